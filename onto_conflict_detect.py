@@ -1,18 +1,70 @@
 import sys
 import os
 import argparse
-from rdflib import Graph, Namespace, URIRef
-from rdflib.namespace import OWL, RDF, RDFS, SKOS
-from collections import defaultdict
+from rdflib import Graph, Literal
+from rdflib.namespace import OWL, RDF, RDFS, XSD
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from rdflib.exceptions import ParserError
 from datetime import datetime
 
+try:
+    # Optional: Rust Turtle parser (pip install pyoxigraph); triples are read
+    # straight into the lookup tables instead of going through an rdflib Graph
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
+
+# Vocabulary terms as interned plain strings, matching the lookup table keys
+# (rdflib terms only compare equal to other terms of the same type)
+RDFS_LABEL = sys.intern(str(RDFS.label))
+RDFS_COMMENT = sys.intern(str(RDFS.comment))
+RDFS_DOMAIN = sys.intern(str(RDFS.domain))
+RDFS_RANGE = sys.intern(str(RDFS.range))
+OWL_CLASS = sys.intern(str(OWL.Class))
+OWL_OBJECT_PROPERTY = sys.intern(str(OWL.ObjectProperty))
+OWL_DATATYPE_PROPERTY = sys.intern(str(OWL.DatatypeProperty))
+OWL_FUNCTIONAL_PROPERTY = sys.intern(str(OWL.FunctionalProperty))
+PROPERTY_TYPES = (OWL_OBJECT_PROPERTY, OWL_DATATYPE_PROPERTY, OWL_FUNCTIONAL_PROPERTY)
+OWL_EQUIVALENT_CLASS = sys.intern(str(OWL.equivalentClass))
+RDF_TYPE = sys.intern(str(RDF.type))
+XSD_STRING = str(XSD.string)
+
+# Short display names for the declaration types above
+TYPE_NAME = {
+    OWL_CLASS: 'Class',
+    OWL_OBJECT_PROPERTY: 'ObjectProperty',
+    OWL_DATATYPE_PROPERTY: 'DatatypeProperty',
+    OWL_FUNCTIONAL_PROPERTY: 'FunctionalProperty',
+}
+
+# More specific inverse patterns - must be at word boundaries
+INVERSE_PATTERNS = [
+    ('hasParent', 'hasChild'),
+    ('parentOf', 'childOf'),
+    ('contains', 'containedIn'),
+    ('includes', 'includedIn'),
+    ('owns', 'ownedBy'),
+    ('manages', 'managedBy'),
+    ('controls', 'controlledBy'),
+    ('above', 'below'),
+    ('before', 'after'),
+    ('precedes', 'follows'),
+    ('greater', 'less'),
+    ('input', 'output'),
+    ('source', 'target'),
+    ('from', 'to'),
+]
+# Lowercased once; matching is case-insensitive
+INVERSE_PATTERNS_LC = [(pattern1.lower(), pattern2.lower()) for pattern1, pattern2 in INVERSE_PATTERNS]
+
 class Logger:
     """Custom logger to write to both console and file"""
     def __init__(self, log_file):
         self.terminal = sys.stdout
-        self.log = open(log_file, 'w', encoding='utf-8')
+        # Buffered; flushed at section boundaries and on close rather than per write
+        self.log = open(log_file, 'w', encoding='utf-8', buffering=1 << 16)
         
         # Write header to log file
         self.log.write(f"CONFLICT ANALYSIS LOG - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -22,7 +74,6 @@ class Logger:
     def write(self, message):
         self.terminal.write(message)
         self.log.write(message)
-        self.log.flush()
     
     def flush(self):
         self.terminal.flush()
@@ -32,12 +83,15 @@ class Logger:
         self.log.close()
 
 class OntologyConflictDetector:
-    def __init__(self, ontology_files, log_file=None, agnostic=False):
+    def __init__(self, ontology_files, log_file=None, agnostic=False, max_report=25):
         """Initialize with multiple ontology files for pre-merge analysis"""
         if isinstance(ontology_files, str):
             self.ontology_files = [ontology_files]
         else:
             self.ontology_files = ontology_files
+        
+        # Display name of each ontology file, computed once
+        self.file_names = {file_path: Path(file_path).name for file_path in self.ontology_files}
             
         if log_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -48,49 +102,218 @@ class OntologyConflictDetector:
         # Namespace-agnostic mode flag
         self.agnostic = agnostic
         
+        # Number of inverse property pairs printed in full; the rest are only counted
+        self.max_report = max_report
+        
         # Initialize logger
         self.logger = None
         
-        # Load all ontologies
-        self.graphs = {}
-        self.combined_graph = Graph()
+        # Detector output for the current section, written out in one call
+        self._out = []
         
-        for file_path in self.ontology_files:
+        # Subject -> predicate -> [objects] index per file, built once at load time
+        self.indexes = {}
+        self.classes_by_file = {}
+        self.properties_by_file = {}
+        
+        # Union of the per-file indexes for cross-ontology analysis, and the
+        # subjects of each rdf:type across all files (dicts used as ordered sets)
+        self.combined_index = defaultdict(lambda: defaultdict(list))
+        self.combined_subjects = defaultdict(dict)
+        
+        # Parse files in worker processes when there is more than one file and CPU;
+        # results are collected, and reported, in input order.
+        # Parsed graphs are not kept: the detectors only read the lookup tables.
+        max_workers = min(len(self.ontology_files), os.cpu_count() or 1)
+        if max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            futures = [executor.submit(load_ontology_tables, file_path) for file_path in self.ontology_files]
+        else:
+            executor = None
+            futures = [None] * len(self.ontology_files)
+        
+        for file_path, future in zip(self.ontology_files, futures):
             try:
                 print(f"Loading ontology: {file_path}")
-                g = Graph()
                 file_size = Path(file_path).stat().st_size / (1024*1024)
                 if file_size > 100:
                     print(f"Large file detected ({file_size:.1f}MB). This may take a while...")
                 
-                g.parse(file_path, format='turtle')
-                self.graphs[file_path] = g
+                if future is None:
+                    triple_count, index, subjects_by_type = self.load_ontology(file_path)
+                else:
+                    triple_count, index, subjects_by_type = self.intern_tables(*future.result())
+                self.indexes[file_path] = index
+                # Declared classes and properties of each type, fixed once per file
+                self.classes_by_file[file_path] = tuple(subjects_by_type[OWL_CLASS])
+                self.properties_by_file[file_path] = {
+                    prop_type: tuple(subjects_by_type[prop_type]) for prop_type in PROPERTY_TYPES
+                }
                 
-                # Add to combined graph for cross-ontology analysis
-                for triple in g:
-                    self.combined_graph.add(triple)
-                    
-                print(f"✓ Loaded {len(g)} triples from {Path(file_path).name}")
+                # Fold into the combined view for cross-ontology analysis. Each file's
+                # lists are already duplicate-free, so only values a previous file
+                # supplied need checking.
+                for s, po in index.items():
+                    combined_po = self.combined_index[s]
+                    for p, objects in po.items():
+                        merged = combined_po[p]
+                        if merged:
+                            present = set(merged)
+                            merged.extend(o for o in objects if o not in present)
+                        else:
+                            merged.extend(objects)
+                for rdf_type, subjects in subjects_by_type.items():
+                    self.combined_subjects[rdf_type].update(dict.fromkeys(subjects))
+                
+                print(f"✓ Loaded {triple_count} triples from {self.file_names[file_path]}")
                 
             except FileNotFoundError:
                 print(f"Error: File not found: {file_path}")
                 continue
-            except ParserError as e:
+            except (ParserError, SyntaxError) as e:
                 print(f"Error parsing {file_path}: {e}")
                 continue
             except Exception as e:
                 print(f"Unexpected error loading {file_path}: {e}")
                 continue
+        
+        if executor is not None:
+            executor.shutdown()
+
+        self.combined_classes = list(self.combined_subjects[OWL_CLASS])
+        
+        # Reverse lookups: URI -> names of the files that declare it with a given type
+        self.class_sources = defaultdict(list)
+        self.objprop_sources = defaultdict(list)
+        self.datatypeprop_sources = defaultdict(list)
+        for file_path, properties in self.properties_by_file.items():
+            file_name = self.file_names[file_path]
+            for uri in self.classes_by_file[file_path]:
+                self.class_sources[uri].append(file_name)
+            for uri in properties[OWL_OBJECT_PROPERTY]:
+                self.objprop_sources[uri].append(file_name)
+            for uri in properties[OWL_DATATYPE_PROPERTY]:
+                self.datatypeprop_sources[uri].append(file_name)
+
+    def load_ontology(self, file_path):
+        """Parse one ontology file and build its lookup tables; returns (triple count, index, subjects by type)"""
+        if pyoxigraph is not None:
+            return self.build_index_oxigraph(file_path)
+        g = Graph()
+        g.parse(file_path, format="turtle")
+        return self.build_index(g)
+    
+    def intern_tables(self, triple_count, index, subjects_by_type):
+        """Rebuild the plain-dict tables returned by load_ontology_tables as load_ontology's.
+
+        Unpickled strings are new objects, so URIs are interned again to share one
+        object with the other files' tables and the vocabulary constants.
+        """
+        interned_index = defaultdict(lambda: defaultdict(list))
+        for s, po in index.items():
+            interned_po = interned_index[sys.intern(s)]
+            for p, objects in po.items():
+                interned_po[sys.intern(p)] = [o if isinstance(o, Literal) else sys.intern(o) for o in objects]
+        interned_types = defaultdict(list)
+        for rdf_type, subjects in subjects_by_type.items():
+            interned_types[sys.intern(rdf_type)] = [sys.intern(s) for s in subjects]
+        return triple_count, interned_index, interned_types
+    
+    def build_index(self, graph):
+        """Build subject -> predicate -> [objects] and rdf:type -> [subjects] lookup tables.
+
+        Every subject is indexed, typed here or not, so annotations such as labels or
+        domains kept in a separate file from the declarations still reach the combined
+        view. Lists keep the graph's insertion order, so "first label" and report
+        ordering match a direct rdflib query.
+        
+        URIs are stored as interned plain strings, so the same URI shares one object
+        across files and keys compare by identity. xsd:string literals become plain
+        literals, since RDF 1.1 (and pyoxigraph) treats "foo" and "foo"^^xsd:string as
+        one term; if both are present only the first is kept. Returns (triple count,
+        index, subjects by type), counting triples after that merge.
+        """
+        index = defaultdict(lambda: defaultdict(list))
+        subjects_by_type = defaultdict(list)
+        triple_count = 0
+        for s, _, rdf_type in graph.triples((None, RDF.type, None)):
+            subjects_by_type[sys.intern(str(rdf_type))].append(sys.intern(str(s)))
+        for s in graph.subjects(unique=True):
+            po = index[sys.intern(str(s))]
+            seen_strings = set()
+            for p, o in graph.predicate_objects(s):
+                p = sys.intern(str(p))
+                if isinstance(o, Literal):
+                    if o.datatype == XSD.string:
+                        o = Literal(str(o))
+                    if o.datatype is None and o.language is None:
+                        if (p, o) in seen_strings:
+                            continue
+                        seen_strings.add((p, o))
+                else:
+                    o = sys.intern(str(o))
+                po[p].append(o)
+                triple_count += 1
+        return triple_count, index, subjects_by_type
+
+    def build_index_oxigraph(self, file_path):
+        """Build the same lookup tables as build_index by streaming pyoxigraph's Turtle parser.
+
+        Triples arrive in document order, which is the order rdflib inserts them in, so
+        both paths give the same tables. Literals are converted to rdflib Literals so the
+        detectors see the same values either way; no graph is kept after parsing.
+        Blank nodes get fresh labels on every parse, as rdflib's BNodes do, so "_:b0" in
+        two files stays two nodes.
+        """
+        index = defaultdict(lambda: defaultdict(list))
+        subjects_by_type = defaultdict(list)
+        seen_triples = set()
+        for quad in pyoxigraph.parse(path=file_path, format=pyoxigraph.RdfFormat.TURTLE,
+                                     base_iri=Path(file_path).absolute().as_uri(),
+                                     rename_blank_nodes=True):
+            subject = sys.intern(quad.subject.value)
+            predicate = sys.intern(quad.predicate.value)
+            o = quad.object
+            if isinstance(o, pyoxigraph.Literal):
+                if o.language:
+                    o = Literal(o.value, lang=o.language)
+                elif o.datatype.value == XSD_STRING:
+                    o = Literal(o.value)
+                else:
+                    o = Literal(o.value, datatype=o.datatype.value)
+            else:
+                o = sys.intern(o.value)
+
+            triple = (subject, predicate, o)
+            if triple in seen_triples:
+                # Repeated triple; a graph would only hold it once
+                continue
+            seen_triples.add(triple)
+            index[subject][predicate].append(o)
+            if predicate == RDF_TYPE:
+                subjects_by_type[o].append(subject)
+        return len(seen_triples), index, subjects_by_type
 
-    # Use a generic namespace for merged ontologies
-    self.merged_namespace = Namespace("http://example.org/merged_namespace#")
+    def iter_declarations(self):
+        """Yield (file name, index, URI, type name) for each class and property declaration, file by file"""
+        for file_path, index in self.indexes.items():
+            file_name = self.file_names[file_path]
+            
+            for uri in self.classes_by_file[file_path]:
+                yield file_name, index, uri, TYPE_NAME[OWL_CLASS]
+            
+            for prop_type, props in self.properties_by_file[file_path].items():
+                type_name = TYPE_NAME[prop_type]
+                for uri in props:
+                    yield file_name, index, uri, type_name
 
-    # Bind common namespaces (agnostic)
-    self.combined_graph.bind("merged", self.merged_namespace)
-    self.combined_graph.bind("owl", OWL)
-    self.combined_graph.bind("rdf", RDF)
-    self.combined_graph.bind("rdfs", RDFS)
-    self.combined_graph.bind("skos", SKOS)
+    def iter_class_labels(self):
+        """Yield (normalized label, URI) for each non-empty label of each combined class"""
+        for uri in self.combined_classes:
+            for label in self.combined_index[uri].get(RDFS_LABEL, ()):
+                normalized_label = str(label).lower().strip()
+                if normalized_label:
+                    yield normalized_label, uri
 
     def get_local_name(self, uri):
         """Extract local name from URI (fragment after '#' or last segment after '/')"""
@@ -124,7 +347,7 @@ class OntologyConflictDetector:
             print("=" * 80)
             print()
         
-        print(f"Ontology Files: {', '.join([Path(f).name for f in self.ontology_files])}")
+        print(f"Ontology Files: {', '.join([self.file_names[f] for f in self.ontology_files])}")
         print(f"Log File: {self.log_file}")
         print(f"Analysis Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 80)
@@ -135,29 +358,44 @@ class OntologyConflictDetector:
             sys.stdout = self.logger.terminal
             self.logger.close()
 
+    def emit(self, message=""):
+        """Queue a line of detector output; see flush_output"""
+        self._out.append(message)
+
+    def flush_output(self):
+        """Write the queued lines to stdout (and so the log) in a single call"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            self._out.clear()
+
     # PRIORITY 1: MERGER-BREAKING CONFLICTS
     
     def detect_uri_collisions(self):
         """Detect same URIs with different definitions across ontology files"""
-        print("\n🔴 PRIORITY 1: URI COLLISION DETECTION")
-        print("=" * 50)
+        self.emit("\n🔴 PRIORITY 1: URI COLLISION DETECTION")
+        self.emit("=" * 50)
         
         if self.agnostic:
             # Namespace-agnostic mode: group by normalized local name
-            uri_definitions = defaultdict(list)
+            # First pass: distinct URIs per local name, so that definition records
+            # are only built for local names shared by more than one URI
+            name_uris = defaultdict(set)
+            for _, _, uri, _ in self.iter_declarations():
+                name_uris[self.normalize_uri(uri)].add(uri)
             
             # Collect all URI definitions from each ontology
-            for file_path, graph in self.graphs.items():
-                file_name = Path(file_path).name
+            uri_definitions = defaultdict(list)
+            for file_name, index, uri, type_name in self.iter_declarations():
+                normalized = self.normalize_uri(uri)
+                if len(name_uris[normalized]) < 2:
+                    continue
+                local_name = self.get_local_name(uri)
+                po = index[uri]
+                labels = po.get(RDFS_LABEL, ())
                 
-                # Check classes
-                for uri in graph.subjects(RDF.type, OWL.Class):
-                    labels = list(graph.objects(uri, RDFS.label))
-                    comments = list(graph.objects(uri, RDFS.comment))
-                    equivalent_classes = list(graph.objects(uri, OWL.equivalentClass))
-                    
-                    normalized = self.normalize_uri(uri)
-                    local_name = self.get_local_name(uri)
+                if type_name == 'Class':
+                    comments = po.get(RDFS_COMMENT, ())
+                    equivalent_classes = po.get(OWL_EQUIVALENT_CLASS, ())
                     
                     uri_definitions[normalized].append({
                         'full_uri': str(uri),
@@ -168,26 +406,19 @@ class OntologyConflictDetector:
                         'comments': [str(c) for c in comments],
                         'equivalent_classes': [str(e) for e in equivalent_classes]
                     })
-                
-                # Check properties
-                for prop_type in [OWL.ObjectProperty, OWL.DatatypeProperty, OWL.FunctionalProperty]:
-                    for uri in graph.subjects(RDF.type, prop_type):
-                        labels = list(graph.objects(uri, RDFS.label))
-                        domains = list(graph.objects(uri, RDFS.domain))
-                        ranges = list(graph.objects(uri, RDFS.range))
-                        
-                        normalized = self.normalize_uri(uri)
-                        local_name = self.get_local_name(uri)
-                        
-                        uri_definitions[normalized].append({
-                            'full_uri': str(uri),
-                            'local_name': local_name,
-                            'file': file_name,
-                            'type': str(prop_type).split('#')[1],
-                            'labels': [str(l) for l in labels],
-                            'domains': [str(d) for d in domains],
-                            'ranges': [str(r) for r in ranges]
-                        })
+                else:
+                    domains = po.get(RDFS_DOMAIN, ())
+                    ranges = po.get(RDFS_RANGE, ())
+                    
+                    uri_definitions[normalized].append({
+                        'full_uri': str(uri),
+                        'local_name': local_name,
+                        'file': file_name,
+                        'type': type_name,
+                        'labels': [str(l) for l in labels],
+                        'domains': [str(d) for d in domains],
+                        'ranges': [str(r) for r in ranges]
+                    })
             
             # Find conflicts based on normalized local names
             conflicts_found = 0
@@ -197,15 +428,15 @@ class OntologyConflictDetector:
                 
                 if len(full_uris) > 1:
                     # Multiple URIs with same local name - check for conflicts
-                    print(f"\n🌐 NAMESPACE-AGNOSTIC URI GROUP: '{normalized_name}'")
-                    print(f"   Local name appears in {len(full_uris)} different URIs:")
+                    self.emit(f"\n🌐 NAMESPACE-AGNOSTIC URI GROUP: '{normalized_name}'")
+                    self.emit(f"   Local name appears in {len(full_uris)} different URIs:")
                     
                     # Show all URIs in the group
                     for uri in sorted(full_uris):
                         uri_defs = [d for d in definitions if d['full_uri'] == uri]
                         files = [d['file'] for d in uri_defs]
-                        print(f"   - {uri}")
-                        print(f"     Files: {', '.join(files)}")
+                        self.emit(f"   - {uri}")
+                        self.emit(f"     Files: {', '.join(files)}")
                     
                     # Check for conflicting definitions
                     labels = set()
@@ -233,28 +464,28 @@ class OntologyConflictDetector:
                         
                         # Only flag if it's not a valid combination
                         if not valid_combo:
-                            print(f"\n   ⚠️  MERGE-BREAKING: Type conflict across namespaces")
-                            print(f"      Different types: {', '.join(types)}")
+                            self.emit(f"\n   ⚠️  MERGE-BREAKING: Type conflict across namespaces")
+                            self.emit(f"      Different types: {', '.join(types)}")
                             for defn in definitions:
-                                print(f"      - {defn['full_uri']}: {defn['type']} (in {defn['file']})")
+                                self.emit(f"      - {defn['full_uri']}: {defn['type']} (in {defn['file']})")
                             has_merge_conflict = True
                     
                     # Range conflicts for properties
                     if len(ranges) > 1 and '' not in ranges:
-                        print(f"\n   ⚠️  MERGE-BREAKING: Range conflict across namespaces")
-                        print(f"      Different ranges: {', '.join(ranges)}")
+                        self.emit(f"\n   ⚠️  MERGE-BREAKING: Range conflict across namespaces")
+                        self.emit(f"      Different ranges: {', '.join(ranges)}")
                         for defn in definitions:
                             if defn.get('ranges'):
-                                print(f"      - {defn['full_uri']}: {', '.join(defn['ranges'])} (in {defn['file']})")
+                                self.emit(f"      - {defn['full_uri']}: {', '.join(defn['ranges'])} (in {defn['file']})")
                         has_merge_conflict = True
                     
                     # Domain conflicts for properties
                     if len(domains) > 1 and '' not in domains:
-                        print(f"\n   ⚠️  MERGE-BREAKING: Domain conflict across namespaces")
-                        print(f"      Different domains: {', '.join(domains)}")
+                        self.emit(f"\n   ⚠️  MERGE-BREAKING: Domain conflict across namespaces")
+                        self.emit(f"      Different domains: {', '.join(domains)}")
                         for defn in definitions:
                             if defn.get('domains'):
-                                print(f"      - {defn['full_uri']}: {', '.join(defn['domains'])} (in {defn['file']})")
+                                self.emit(f"      - {defn['full_uri']}: {', '.join(defn['domains'])} (in {defn['file']})")
                         has_merge_conflict = True
                     
                     # Label conflicts (significant differences)
@@ -262,55 +493,55 @@ class OntologyConflictDetector:
                         # Check if labels are significantly different (not just case/whitespace)
                         normalized_labels = {l.lower().strip() for l in labels if l}
                         if len(normalized_labels) > 1:
-                            print(f"\n   ℹ️  SEMANTIC CANDIDATE: Label differences")
-                            print(f"      Different labels: {', '.join(labels)}")
+                            self.emit(f"\n   ℹ️  SEMANTIC CANDIDATE: Label differences")
+                            self.emit(f"      Different labels: {', '.join(labels)}")
                             for defn in definitions:
                                 if defn.get('labels'):
-                                    print(f"      - {defn['full_uri']}: {', '.join(defn['labels'])} (in {defn['file']})")
+                                    self.emit(f"      - {defn['full_uri']}: {', '.join(defn['labels'])} (in {defn['file']})")
                             has_semantic_conflict = True
                     
                     if has_merge_conflict or has_semantic_conflict:
                         conflicts_found += 1
             
-            print(f"\n📊 URI COLLISION SUMMARY (AGNOSTIC MODE): {conflicts_found} conflict groups found")
-            print("   These represent URIs with identical local names across different namespaces.")
+            self.emit(f"\n📊 URI COLLISION SUMMARY (AGNOSTIC MODE): {conflicts_found} conflict groups found")
+            self.emit("   These represent URIs with identical local names across different namespaces.")
             
         else:
             # Original exact-URI comparison mode
-            uri_definitions = defaultdict(list)
+            # First pass: count definitions per URI, so that definition records are
+            # only built for URIs defined more than once
+            definition_counts = Counter(uri for _, _, uri, _ in self.iter_declarations())
             
             # Collect all URI definitions from each ontology
-            for file_path, graph in self.graphs.items():
-                file_name = Path(file_path).name
+            uri_definitions = defaultdict(list)
+            for file_name, index, uri, type_name in self.iter_declarations():
+                if definition_counts[uri] < 2:
+                    continue
+                po = index[uri]
+                labels = po.get(RDFS_LABEL, ())
                 
-                # Check classes
-                for uri in graph.subjects(RDF.type, OWL.Class):
-                    labels = list(graph.objects(uri, RDFS.label))
-                    comments = list(graph.objects(uri, RDFS.comment))
-                    equivalent_classes = list(graph.objects(uri, OWL.equivalentClass))
+                if type_name == 'Class':
+                    comments = po.get(RDFS_COMMENT, ())
+                    equivalent_classes = po.get(OWL_EQUIVALENT_CLASS, ())
                     
-                    uri_definitions[str(uri)].append({
+                    uri_definitions[uri].append({
                         'file': file_name,
                         'type': 'Class',
                         'labels': [str(l) for l in labels],
                         'comments': [str(c) for c in comments],
                         'equivalent_classes': [str(e) for e in equivalent_classes]
                     })
-                
-                # Check properties
-                for prop_type in [OWL.ObjectProperty, OWL.DatatypeProperty, OWL.FunctionalProperty]:
-                    for uri in graph.subjects(RDF.type, prop_type):
-                        labels = list(graph.objects(uri, RDFS.label))
-                        domains = list(graph.objects(uri, RDFS.domain))
-                        ranges = list(graph.objects(uri, RDFS.range))
-                        
-                        uri_definitions[str(uri)].append({
-                            'file': file_name,
-                            'type': str(prop_type).split('#')[1],
-                            'labels': [str(l) for l in labels],
-                            'domains': [str(d) for d in domains],
-                            'ranges': [str(r) for r in ranges]
-                        })
+                else:
+                    domains = po.get(RDFS_DOMAIN, ())
+                    ranges = po.get(RDFS_RANGE, ())
+                    
+                    uri_definitions[uri].append({
+                        'file': file_name,
+                        'type': type_name,
+                        'labels': [str(l) for l in labels],
+                        'domains': [str(d) for d in domains],
+                        'ranges': [str(r) for r in ranges]
+                    })
             
             # Find conflicts
             conflicts_found = 0
@@ -341,19 +572,19 @@ class OntologyConflictDetector:
                         
                         # Only flag if it's not a valid combination
                         if not valid_combo:
-                            print(f"\n⚠️  URI TYPE CONFLICT: {uri}")
-                            print(f"   Different types across files: {', '.join(types)}")
+                            self.emit(f"\n⚠️  URI TYPE CONFLICT: {uri}")
+                            self.emit(f"   Different types across files: {', '.join(types)}")
                             for defn in definitions:
-                                print(f"   - {defn['file']}: {defn['type']}")
+                                self.emit(f"   - {defn['file']}: {defn['type']}")
                             has_conflict = True
                     
                     # Range conflicts for properties
                     if len(ranges) > 1 and '' not in ranges:
-                        print(f"\n⚠️  PROPERTY RANGE CONFLICT: {uri}")
-                        print(f"   Different ranges: {', '.join(ranges)}")
+                        self.emit(f"\n⚠️  PROPERTY RANGE CONFLICT: {uri}")
+                        self.emit(f"   Different ranges: {', '.join(ranges)}")
                         for defn in definitions:
                             if defn.get('ranges'):
-                                print(f"   - {defn['file']}: {', '.join(defn['ranges'])}")
+                                self.emit(f"   - {defn['file']}: {', '.join(defn['ranges'])}")
                         has_conflict = True
                     
                     # Label conflicts (significant differences)
@@ -361,39 +592,40 @@ class OntologyConflictDetector:
                         # Check if labels are significantly different (not just case/whitespace)
                         normalized_labels = {l.lower().strip() for l in labels if l}
                         if len(normalized_labels) > 1:
-                            print(f"\n⚠️  LABEL CONFLICT: {uri}")
-                            print(f"   Different labels: {', '.join(labels)}")
+                            self.emit(f"\n⚠️  LABEL CONFLICT: {uri}")
+                            self.emit(f"   Different labels: {', '.join(labels)}")
                             for defn in definitions:
                                 if defn.get('labels'):
-                                    print(f"   - {defn['file']}: {', '.join(defn['labels'])}")
+                                    self.emit(f"   - {defn['file']}: {', '.join(defn['labels'])}")
                             has_conflict = True
                     
                     if has_conflict:
                         conflicts_found += 1
             
-            print(f"\n📊 URI COLLISION SUMMARY: {conflicts_found} conflicts found")
-            print("   These conflicts will break ontology merging!")
+            self.emit(f"\n📊 URI COLLISION SUMMARY: {conflicts_found} conflicts found")
+            self.emit("   These conflicts will break ontology merging!")
         
+        self.flush_output()
         return conflicts_found
 
     def detect_property_type_conflicts(self):
         """Detect properties with conflicting types (ObjectProperty vs DatatypeProperty)"""
-        print("\n🔴 PRIORITY 1: PROPERTY TYPE CONFLICTS")
-        print("=" * 50)
+        self.emit("\n🔴 PRIORITY 1: PROPERTY TYPE CONFLICTS")
+        self.emit("=" * 50)
         
         if self.agnostic:
             # Namespace-agnostic mode: group by normalized local name
             property_types = defaultdict(set)
             
             # Collect property types from all ontologies
-            for file_path, graph in self.graphs.items():
-                file_name = Path(file_path).name
+            for file_path, properties in self.properties_by_file.items():
+                file_name = self.file_names[file_path]
                 
-                for prop_type in [OWL.ObjectProperty, OWL.DatatypeProperty, OWL.FunctionalProperty]:
-                    for prop in graph.subjects(RDF.type, prop_type):
+                for prop_type, props in properties.items():
+                    type_name = TYPE_NAME[prop_type]
+                    for prop in props:
                         normalized = self.normalize_uri(prop)
                         full_uri = str(prop)
-                        type_name = str(prop_type).split('#')[1]
                         property_types[normalized].add((type_name, file_name, full_uri))
             
             # Find REAL conflicts (only ObjectProperty vs DatatypeProperty)
@@ -409,28 +641,29 @@ class OntologyConflictDetector:
                     conflicts.append((normalized_name, type_info))
             
             if conflicts:
-                print(f"Found {len(conflicts)} REAL property type conflicts (across namespaces):")
+                self.emit(f"Found {len(conflicts)} REAL property type conflicts (across namespaces):")
                 for normalized_name, type_info in conflicts[:10]:  # Show first 10
-                    print(f"\n⚠️  Local name: '{normalized_name}'")
+                    self.emit(f"\n⚠️  Local name: '{normalized_name}'")
                     for type_name, file_name, full_uri in type_info:
-                        print(f"   - {type_name}: {full_uri} (in {file_name})")
-                print("\n   Note: These are genuine conflicts - a property cannot be both")
-                print("         ObjectProperty and DatatypeProperty simultaneously,")
-                print("         even across different namespaces.")
+                        self.emit(f"   - {type_name}: {full_uri} (in {file_name})")
+                self.emit("\n   Note: These are genuine conflicts - a property cannot be both")
+                self.emit("         ObjectProperty and DatatypeProperty simultaneously,")
+                self.emit("         even across different namespaces.")
             else:
-                print("✅ No property type conflicts found (namespace-agnostic)")
-                print("   (FunctionalProperty can coexist with ObjectProperty or DatatypeProperty)")
+                self.emit("✅ No property type conflicts found (namespace-agnostic)")
+                self.emit("   (FunctionalProperty can coexist with ObjectProperty or DatatypeProperty)")
         else:
             # Original exact-URI mode
             property_types = defaultdict(set)
             
             # Collect property types from all ontologies
-            for file_path, graph in self.graphs.items():
-                file_name = Path(file_path).name
+            for file_path, properties in self.properties_by_file.items():
+                file_name = self.file_names[file_path]
                 
-                for prop_type in [OWL.ObjectProperty, OWL.DatatypeProperty, OWL.FunctionalProperty]:
-                    for prop in graph.subjects(RDF.type, prop_type):
-                        property_types[str(prop)].add((str(prop_type).split('#')[1], file_name))
+                for prop_type, props in properties.items():
+                    type_name = TYPE_NAME[prop_type]
+                    for prop in props:
+                        property_types[str(prop)].add((type_name, file_name))
             
             # Find REAL conflicts (only ObjectProperty vs DatatypeProperty)
             conflicts = []
@@ -445,257 +678,204 @@ class OntologyConflictDetector:
                     conflicts.append((prop, types))
             
             if conflicts:
-                print(f"Found {len(conflicts)} REAL property type conflicts:")
+                self.emit(f"Found {len(conflicts)} REAL property type conflicts:")
                 for prop, types in conflicts[:10]:  # Show first 10
-                    print(f"\n⚠️  {prop}")
+                    self.emit(f"\n⚠️  {prop}")
                     for type_name, file_name in types:
-                        print(f"   - {type_name} in {file_name}")
-                print("\n   Note: These are genuine conflicts - a property cannot be both")
-                print("         ObjectProperty and DatatypeProperty simultaneously.")
+                        self.emit(f"   - {type_name} in {file_name}")
+                self.emit("\n   Note: These are genuine conflicts - a property cannot be both")
+                self.emit("         ObjectProperty and DatatypeProperty simultaneously.")
             else:
-                print("✅ No property type conflicts found")
-                print("   (FunctionalProperty can coexist with ObjectProperty or DatatypeProperty)")
+                self.emit("✅ No property type conflicts found")
+                self.emit("   (FunctionalProperty can coexist with ObjectProperty or DatatypeProperty)")
         
+        self.flush_output()
         return len(conflicts)
 
     # PRIORITY 2: SEMANTIC CONFLICTS
     
     def detect_semantic_duplicates(self):
         """Detect different URIs that likely represent the same concepts"""
-        print("\n🟡 PRIORITY 2: SEMANTIC DUPLICATE DETECTION")
-        print("=" * 50)
+        self.emit("\n🟡 PRIORITY 2: SEMANTIC DUPLICATE DETECTION")
+        self.emit("=" * 50)
+        
+        # Group classes by their labels (case-insensitive); both modes use it.
+        # Count first so only labels shared by several classes get a list.
+        label_counts = Counter(normalized_label for normalized_label, _ in self.iter_class_labels())
+        label_groups = defaultdict(list)
+        for normalized_label, uri in self.iter_class_labels():
+            if label_counts[normalized_label] > 1:
+                label_groups[normalized_label].append(uri)
         
         if self.agnostic:
             # Namespace-agnostic mode: group by normalized local name AND label
             # Combine both name-based and label-based grouping
             name_groups = defaultdict(list)
-            label_groups = defaultdict(list)
-            
-            for uri in self.combined_graph.subjects(RDF.type, OWL.Class):
-                # Group by normalized local name
-                normalized_name = self.normalize_uri(uri)
-                name_groups[normalized_name].append(str(uri))
-                
-                # Also group by labels
-                labels = list(self.combined_graph.objects(uri, RDFS.label))
-                for label in labels:
-                    normalized_label = str(label).lower().strip()
-                    if normalized_label:
-                        label_groups[normalized_label].append(str(uri))
+            for uri in self.combined_classes:
+                name_groups[self.normalize_uri(uri)].append(uri)
             
             # Report name-based duplicates
             duplicates_found = 0
             seen_uris = set()
             
-            print("\n📌 Classes grouped by local name:")
+            self.emit("\n📌 Classes grouped by local name:")
             for name, uris in name_groups.items():
                 if len(uris) > 1:
-                    print(f"\n🔍 Local name '{name}' appears in {len(uris)} URIs:")
+                    self.emit(f"\n🔍 Local name '{name}' appears in {len(uris)} URIs:")
                     for uri in uris:
                         # Find which file this URI comes from
-                        source_files = []
-                        for file_path, graph in self.graphs.items():
-                            if (URIRef(uri), RDF.type, OWL.Class) in graph:
-                                source_files.append(Path(file_path).name)
-                        print(f"   - {uri} (from: {', '.join(source_files)})")
+                        source_files = self.class_sources.get(uri, ())
+                        self.emit(f"   - {uri} (from: {', '.join(source_files)})")
                         seen_uris.add(uri)
                     duplicates_found += 1
             
-            print("\n📌 Classes grouped by label (not already shown):")
+            self.emit("\n📌 Classes grouped by label (not already shown):")
             for label, uris in label_groups.items():
-                if len(uris) > 1:
-                    # Only show if URIs weren't already reported in name groups
-                    new_uris = [u for u in uris if u not in seen_uris]
-                    if len(new_uris) > 1:
-                        print(f"\n🔍 Potential semantic duplicates for '{label}':")
-                        for uri in new_uris:
-                            # Find which file this URI comes from
-                            source_files = []
-                            for file_path, graph in self.graphs.items():
-                                if (URIRef(uri), RDF.type, OWL.Class) in graph:
-                                    source_files.append(Path(file_path).name)
-                            print(f"   - {uri} (from: {', '.join(source_files)})")
-                        duplicates_found += 1
+                # Only show if URIs weren't already reported in name groups
+                new_uris = [u for u in uris if u not in seen_uris]
+                if len(new_uris) > 1:
+                    self.emit(f"\n🔍 Potential semantic duplicates for '{label}':")
+                    for uri in new_uris:
+                        # Find which file this URI comes from
+                        source_files = self.class_sources.get(uri, ())
+                        self.emit(f"   - {uri} (from: {', '.join(source_files)})")
+                    duplicates_found += 1
         else:
             # Original label-based mode
-            # Group classes by their labels (case-insensitive)
-            label_groups = defaultdict(list)
-            
-            for uri in self.combined_graph.subjects(RDF.type, OWL.Class):
-                labels = list(self.combined_graph.objects(uri, RDFS.label))
-                for label in labels:
-                    normalized_label = str(label).lower().strip()
-                    if normalized_label:
-                        label_groups[normalized_label].append(str(uri))
-            
             # Find potential duplicates
             duplicates_found = 0
             for label, uris in label_groups.items():
-                if len(uris) > 1:
-                    print(f"\n🔍 Potential semantic duplicates for '{label}':")
-                    for uri in uris:
-                        # Find which file this URI comes from
-                        source_files = []
-                        for file_path, graph in self.graphs.items():
-                            if (URIRef(uri), RDF.type, OWL.Class) in graph:
-                                source_files.append(Path(file_path).name)
-                        print(f"   - {uri} (from: {', '.join(source_files)})")
-                    duplicates_found += 1
+                self.emit(f"\n🔍 Potential semantic duplicates for '{label}':")
+                for uri in uris:
+                    # Find which file this URI comes from
+                    source_files = self.class_sources.get(uri, ())
+                    self.emit(f"   - {uri} (from: {', '.join(source_files)})")
+                duplicates_found += 1
         
         mode_suffix = " (AGNOSTIC MODE)" if self.agnostic else ""
-        print(f"\n📊 SEMANTIC DUPLICATES SUMMARY{mode_suffix}: {duplicates_found} potential duplicate groups found")
+        self.emit(f"\n📊 SEMANTIC DUPLICATES SUMMARY{mode_suffix}: {duplicates_found} potential duplicate groups found")
+        self.flush_output()
         return duplicates_found
 
     def detect_equivalent_class_candidates(self):
         """Detect classes that might be equivalent but not declared as such"""
-        print("\n🟡 PRIORITY 2: EQUIVALENT CLASS CANDIDATES")
-        print("=" * 50)
+        self.emit("\n🟡 PRIORITY 2: EQUIVALENT CLASS CANDIDATES")
+        self.emit("=" * 50)
         
         # Look for classes with similar names but different URIs
-        class_info = {}
-        
-        for uri in self.combined_graph.subjects(RDF.type, OWL.Class):
-            labels = [str(l) for l in self.combined_graph.objects(uri, RDFS.label)]
-            comments = [str(c) for c in self.combined_graph.objects(uri, RDFS.comment)]
-            
-            # Extract class name from URI
-            if self.agnostic:
+        # Similarity key per class: first label if available, otherwise class name
+        similar_keys = []
+        for uri in self.combined_classes:
+            labels = self.combined_index[uri].get(RDFS_LABEL, ())
+            if labels:
+                similar_keys.append(str(labels[0]).lower())
+            elif self.agnostic:
                 # Use normalized local name in agnostic mode
-                class_name = self.normalize_uri(uri)
+                similar_keys.append(self.normalize_uri(uri).lower())
             else:
                 # Original: extract from URI
-                class_name = str(uri).split('/')[-1].split('#')[-1]
-            
-            class_info[str(uri)] = {
-                'name': class_name,
-                'labels': labels,
-                'comments': comments
-            }
+                similar_keys.append(str(uri).split('/')[-1].split('#')[-1].lower())
         
-        # Group by similar names/labels
+        # Group by similar names/labels.
+        # Count first so only keys shared by several classes get a list.
+        key_counts = Counter(similar_keys)
         similar_groups = defaultdict(list)
         
-        for uri, info in class_info.items():
-            # Use first label if available, otherwise use class name
-            key = info['labels'][0].lower() if info['labels'] else info['name'].lower()
-            similar_groups[key].append((uri, info))
+        for key, uri in zip(similar_keys, self.combined_classes):
+            if key_counts[key] > 1:
+                similar_groups[key].append(uri)
         
-        # Find groups with multiple classes
+        # Report groups with multiple classes
         candidates_found = 0
         for key, classes in similar_groups.items():
-            if len(classes) > 1:
-                print(f"\n🎯 Similar classes for '{key}':")
-                for uri, info in classes:
-                    source_files = []
-                    for file_path, graph in self.graphs.items():
-                        if (URIRef(uri), RDF.type, OWL.Class) in graph:
-                            source_files.append(Path(file_path).name)
-                    
-                    if self.agnostic:
-                        local_name = self.get_local_name(uri)
-                        print(f"   - {uri} (local: {local_name})")
-                    else:
-                        print(f"   - {uri}")
-                    print(f"     Labels: {', '.join(info['labels']) if info['labels'] else 'None'}")
-                    print(f"     Sources: {', '.join(source_files)}")
-                candidates_found += 1
+            self.emit(f"\n🎯 Similar classes for '{key}':")
+            for uri in classes:
+                labels = [str(l) for l in self.combined_index[uri].get(RDFS_LABEL, ())]
+                source_files = self.class_sources.get(uri, ())
+                
+                if self.agnostic:
+                    local_name = self.get_local_name(uri)
+                    self.emit(f"   - {uri} (local: {local_name})")
+                else:
+                    self.emit(f"   - {uri}")
+                self.emit(f"     Labels: {', '.join(labels) if labels else 'None'}")
+                self.emit(f"     Sources: {', '.join(source_files)}")
+            candidates_found += 1
         
         mode_suffix = " (AGNOSTIC MODE)" if self.agnostic else ""
-        print(f"\n📊 EQUIVALENT CLASS CANDIDATES{mode_suffix}: {candidates_found} groups found")
+        self.emit(f"\n📊 EQUIVALENT CLASS CANDIDATES{mode_suffix}: {candidates_found} groups found")
+        self.flush_output()
         return candidates_found
 
     # PRIORITY 3: ADDITIONAL ANALYSES
     
     def detect_class_conflicts(self):
         """Detect general class-related conflicts"""
-        print("\n🟢 PRIORITY 3: CLASS-LEVEL CONFLICTS")
-        print("=" * 50)
+        self.emit("\n🟢 PRIORITY 3: CLASS-LEVEL CONFLICTS")
+        self.emit("=" * 50)
         
         # Check for classes with no labels
         unlabeled_classes = []
-        for uri in self.combined_graph.subjects(RDF.type, OWL.Class):
-            labels = list(self.combined_graph.objects(uri, RDFS.label))
+        for uri in self.combined_classes:
+            labels = self.combined_index[uri].get(RDFS_LABEL, ())
             if not labels:
                 # Find source files
-                source_files = []
-                for file_path, graph in self.graphs.items():
-                    if (uri, RDF.type, OWL.Class) in graph:
-                        source_files.append(Path(file_path).name)
+                source_files = self.class_sources.get(str(uri), ())
                 unlabeled_classes.append((str(uri), source_files))
         
         if unlabeled_classes:
-            print(f"Found {len(unlabeled_classes)} classes without labels:")
+            self.emit(f"Found {len(unlabeled_classes)} classes without labels:")
             for uri, sources in unlabeled_classes[:10]:  # Show first 10
-                print(f"   - {uri} (from: {', '.join(sources)})")
+                self.emit(f"   - {uri} (from: {', '.join(sources)})")
         else:
-            print("✅ All classes have labels")
+            self.emit("✅ All classes have labels")
         
+        self.flush_output()
         return len(unlabeled_classes)
 
     def detect_property_conflicts(self):
         """Detect general property-related conflicts"""
-        print("\n🟢 PRIORITY 3: PROPERTY-LEVEL CONFLICTS")
-        print("=" * 50)
+        self.emit("\n🟢 PRIORITY 3: PROPERTY-LEVEL CONFLICTS")
+        self.emit("=" * 50)
         
         # Check for properties with no domains or ranges
         underspecified_properties = []
         
-        for prop_type in [OWL.ObjectProperty, OWL.DatatypeProperty]:
-            for prop in self.combined_graph.subjects(RDF.type, prop_type):
-                domains = list(self.combined_graph.objects(prop, RDFS.domain))
-                ranges = list(self.combined_graph.objects(prop, RDFS.range))
+        for prop_type, prop_sources in [(OWL_OBJECT_PROPERTY, self.objprop_sources),
+                                        (OWL_DATATYPE_PROPERTY, self.datatypeprop_sources)]:
+            for prop in self.combined_subjects[prop_type]:
+                po = self.combined_index[prop]
+                domains = po.get(RDFS_DOMAIN, ())
+                ranges = po.get(RDFS_RANGE, ())
                 
                 if not domains and not ranges:
                     # Find source files
-                    source_files = []
-                    for file_path, graph in self.graphs.items():
-                        if (prop, RDF.type, prop_type) in graph:
-                            source_files.append(Path(file_path).name)
-                    underspecified_properties.append((str(prop), str(prop_type).split('#')[1], source_files))
+                    source_files = prop_sources.get(str(prop), ())
+                    underspecified_properties.append((str(prop), TYPE_NAME[prop_type], source_files))
         
         if underspecified_properties:
-            print(f"Found {len(underspecified_properties)} properties without domain/range:")
+            self.emit(f"Found {len(underspecified_properties)} properties without domain/range:")
             for prop, prop_type, sources in underspecified_properties[:10]:  # Show first 10
-                print(f"   - {prop} ({prop_type}) (from: {', '.join(sources)})")
+                self.emit(f"   - {prop} ({prop_type}) (from: {', '.join(sources)})")
         else:
-            print("✅ All properties have domain or range specified")
+            self.emit("✅ All properties have domain or range specified")
         
+        self.flush_output()
         return len(underspecified_properties)
 
     def detect_inverse_property_candidates(self):
         """Detect properties that might be inverses of each other"""
-        print("\n🟡 PRIORITY 2: INVERSE PROPERTY DETECTION")
-        print("=" * 50)
-        
-        # More specific inverse patterns - must be at word boundaries
-        inverse_patterns = [
-            ('hasParent', 'hasChild'),
-            ('parentOf', 'childOf'),
-            ('contains', 'containedIn'),
-            ('includes', 'includedIn'),
-            ('owns', 'ownedBy'),
-            ('manages', 'managedBy'),
-            ('controls', 'controlledBy'),
-            ('above', 'below'),
-            ('before', 'after'),
-            ('precedes', 'follows'),
-            ('greater', 'less'),
-            ('input', 'output'),
-            ('source', 'target'),
-            ('from', 'to'),
-        ]
+        self.emit("\n🟡 PRIORITY 2: INVERSE PROPERTY DETECTION")
+        self.emit("=" * 50)
         
         # Get all object properties with their source files
         properties = []
-        for prop in self.combined_graph.subjects(RDF.type, OWL.ObjectProperty):
+        for prop in self.combined_subjects[OWL_OBJECT_PROPERTY]:
             prop_str = str(prop)
-            labels = [str(l) for l in self.combined_graph.objects(prop, RDFS.label)]
+            labels = [str(l) for l in self.combined_index[prop].get(RDFS_LABEL, ())]
             
             # Find source files for this property
-            source_files = []
-            for file_path, graph in self.graphs.items():
-                if (prop, RDF.type, OWL.ObjectProperty) in graph:
-                    source_files.append(Path(file_path).name)
+            source_files = self.objprop_sources.get(prop_str, ())
             
             # Store both full URI and normalized local name
             if self.agnostic:
@@ -704,101 +884,100 @@ class OntologyConflictDetector:
             else:
                 properties.append((prop_str, None, labels, source_files))
         
-        # Find potential inverse relationships
-        inverse_candidates = []
+        # Find potential inverse relationships. Instead of comparing every pair of
+        # properties, record which side of which pattern each property matches and
+        # only pair up properties found on opposite sides of the same pattern.
+        label_tokens = defaultdict(list)
+        for k, (pattern1, pattern2) in enumerate(INVERSE_PATTERNS_LC):
+            label_tokens[pattern1].append((k, 0))
+            label_tokens[pattern2].append((k, 1))
         
-        for i, prop_info1 in enumerate(properties):
-            for prop_info2 in properties[i+1:]:
-                if self.agnostic:
-                    prop1, local1, labels1, sources1 = prop_info1
-                    prop2, local2, labels2, sources2 = prop_info2
-                    
-                    if prop1 == prop2:
-                        continue
-                    
-                    # Check both URI-based and local name patterns
-                    prop1_name = local1 if local1 else prop1.split('/')[-1].split('#')[-1]
-                    prop2_name = local2 if local2 else prop2.split('/')[-1].split('#')[-1]
-                else:
-                    prop1, _, labels1, sources1 = prop_info1
-                    prop2, _, labels2, sources2 = prop_info2
-                    
-                    if prop1 == prop2:
-                        continue
-                    
-                    # Extract property names from URIs
-                    prop1_name = prop1.split('/')[-1].split('#')[-1]
-                    prop2_name = prop2.split('/')[-1].split('#')[-1]
-                
-                # Check URI-based patterns (more reliable)
-                for pattern1, pattern2 in inverse_patterns:
-                    if ((pattern1.lower() in prop1_name.lower() and pattern2.lower() in prop2_name.lower()) or
-                        (pattern2.lower() in prop1_name.lower() and pattern1.lower() in prop2_name.lower())):
-                        
-                        # Use first label if available, otherwise use property name
-                        label1 = labels1[0] if labels1 else prop1_name
-                        label2 = labels2[0] if labels2 else prop2_name
-                        
-                        if self.agnostic:
-                            inverse_candidates.append((prop1, prop2, label1, label2, sources1, sources2, local1, local2))
-                        else:
-                            inverse_candidates.append((prop1, prop2, label1, label2, sources1, sources2, None, None))
-                        break
-                
-                # Also check for exact label-based patterns (case-insensitive)
-                if labels1 and labels2:
-                    for label1 in labels1:
-                        for label2 in labels2:
-                            label1_clean = label1.lower().strip()
-                            label2_clean = label2.lower().strip()
-                            
-                            for pattern1, pattern2 in inverse_patterns:
-                                if ((pattern1.lower() == label1_clean and pattern2.lower() == label2_clean) or
-                                    (pattern2.lower() == label1_clean and pattern1.lower() == label2_clean)):
-                                    if self.agnostic:
-                                        inverse_candidates.append((prop1, prop2, label1, label2, sources1, sources2, local1, local2))
-                                    else:
-                                        inverse_candidates.append((prop1, prop2, label1, label2, sources1, sources2, None, None))
-                                    break
-        
-        # Remove duplicates
+        names = []
+        label_hits_by_prop = []
+        name_buckets = defaultdict(lambda: ([], []))
+        label_buckets = defaultdict(lambda: ([], []))
+        for idx, (prop, local_name, labels, _) in enumerate(properties):
+            # Local name in agnostic mode, otherwise the URI's last segment
+            name = local_name if local_name else prop.split('/')[-1].split('#')[-1]
+            names.append(name)
+            
+            # URI-based patterns: substring match on the property name
+            name_lc = name.lower()
+            for k, (pattern1, pattern2) in enumerate(INVERSE_PATTERNS_LC):
+                if pattern1 in name_lc:
+                    name_buckets[k][0].append(idx)
+                if pattern2 in name_lc:
+                    name_buckets[k][1].append(idx)
+            
+            # Label-based patterns: exact match on any label, normalized once per label
+            label_hits = [label_tokens.get(label.lower().strip(), ()) for label in labels]
+            label_hits_by_prop.append(label_hits)
+            for k, side in {hit for hits in label_hits for hit in hits}:
+                label_buckets[k][side].append(idx)
+        
+        name_pairs = set()
+        label_pairs = set()
+        for buckets, pairs in ((name_buckets, name_pairs), (label_buckets, label_pairs)):
+            for side1, side2 in buckets.values():
+                for idx1 in side1:
+                    for idx2 in side2:
+                        if idx1 != idx2:
+                            pairs.add((min(idx1, idx2), max(idx1, idx2)))
+        
+        # Each index pair is one distinct property pair, so the total is known up front
+        # and candidate details are only built for the pairs that get printed.
+        candidate_pairs = sorted(name_pairs | label_pairs)
+        total_candidates = len(candidate_pairs)
+        
+        # Emit in property order, URI match before label matches, as the pairwise scan did.
         unique_candidates = []
-        seen = set()
-        for candidate in inverse_candidates:
-            p1, p2 = candidate[0], candidate[1]
-            pair = tuple(sorted([p1, p2]))
-            if pair not in seen:
-                seen.add(pair)
-                unique_candidates.append(candidate)
-        
-        if unique_candidates:
+        for idx1, idx2 in candidate_pairs[:self.max_report]:
+            prop1, local1, labels1, sources1 = properties[idx1]
+            prop2, local2, labels2, sources2 = properties[idx2]
+            
+            if (idx1, idx2) in name_pairs:
+                # Use first label if available, otherwise use property name
+                label1 = labels1[0] if labels1 else names[idx1]
+                label2 = labels2[0] if labels2 else names[idx2]
+            else:
+                # First pair of labels sitting on opposite sides of a shared pattern
+                label1, label2 = next(
+                    (label1, label2)
+                    for label1, hits1 in zip(labels1, label_hits_by_prop[idx1])
+                    for label2, hits2 in zip(labels2, label_hits_by_prop[idx2])
+                    if any((k, 1 - side) in hits2 for k, side in hits1)
+                )
+            unique_candidates.append((prop1, prop2, label1, label2, sources1, sources2, local1, local2))
+        
+        if total_candidates:
             mode_suffix = " (namespace-agnostic)" if self.agnostic else ""
-            print(f"Found {len(unique_candidates)} potential inverse property pairs{mode_suffix}:")
+            self.emit(f"Found {total_candidates} potential inverse property pairs{mode_suffix}:")
             # Show more results since we're being more selective
-            for candidate in unique_candidates[:25]:  # Show first 25
+            for candidate in unique_candidates:
                 p1, p2, l1, l2, s1, s2 = candidate[:6]
                 
                 if self.agnostic and len(candidate) > 6:
                     local1, local2 = candidate[6], candidate[7]
-                    print(f"\n🔗 {p1}")
-                    print(f"   Local name: {local1} | Label: ({l1})")
+                    self.emit(f"\n🔗 {p1}")
+                    self.emit(f"   Local name: {local1} | Label: ({l1})")
                 else:
-                    print(f"\n🔗 {p1} ({l1})")
-                print(f"   Sources: {', '.join(s1)}")
+                    self.emit(f"\n🔗 {p1} ({l1})")
+                self.emit(f"   Sources: {', '.join(s1)}")
                 
                 if self.agnostic and len(candidate) > 6:
-                    print(f"   ↔️  {p2}")
-                    print(f"   Local name: {local2} | Label: ({l2})")
+                    self.emit(f"   ↔️  {p2}")
+                    self.emit(f"   Local name: {local2} | Label: ({l2})")
                 else:
-                    print(f"   ↔️  {p2} ({l2})")
-                print(f"   Sources: {', '.join(s2)}")
+                    self.emit(f"   ↔️  {p2} ({l2})")
+                self.emit(f"   Sources: {', '.join(s2)}")
             
-            if len(unique_candidates) > 25:
-                print(f"\n... and {len(unique_candidates) - 25} more pairs")
+            if total_candidates > len(unique_candidates):
+                self.emit(f"\n... and {total_candidates - len(unique_candidates)} more pairs")
         else:
-            print("✓ No obvious inverse property candidates found")
+            self.emit("✓ No obvious inverse property candidates found")
         
-        return len(unique_candidates)
+        self.flush_output()
+        return total_candidates
 
     # ...existing code...
     
@@ -809,23 +988,26 @@ class OntologyConflictDetector:
         try:
             print("\nCOMPREHENSIVE ONTOLOGY CONFLICT ANALYSIS")
             print("=" * 60)
-            print(f"Analyzing: {', '.join([Path(f).name for f in self.ontology_files])}")
+            print(f"Analyzing: {', '.join([self.file_names[f] for f in self.ontology_files])}")
             
             # PRIORITY 1: Merger-breaking conflicts
             print("\n" + "🔴" * 20 + " PRIORITY 1 CONFLICTS " + "🔴" * 20)
             uri_conflicts = self.detect_uri_collisions()
             type_conflicts = self.detect_property_type_conflicts()
+            sys.stdout.flush()
             
             # PRIORITY 2: Semantic conflicts  
             print("\n" + "🟡" * 20 + " PRIORITY 2 CONFLICTS " + "🟡" * 20)
             semantic_duplicates = self.detect_semantic_duplicates()
             inverse_candidates = self.detect_inverse_property_candidates()
             equivalent_candidates = self.detect_equivalent_class_candidates()
+            sys.stdout.flush()
             
             # PRIORITY 3: Existing analyses
             print("\n" + "🟢" * 20 + " PRIORITY 3 CONFLICTS " + "🟢" * 20)
             self.detect_class_conflicts()
             self.detect_property_conflicts()
+            sys.stdout.flush()
             
             # Summary
             print("\n" + "=" * 80)
@@ -847,12 +1029,20 @@ class OntologyConflictDetector:
                 print(f"\n✅ No critical conflicts found. Safe to proceed with merging.")
                 
         except Exception as e:
+            # Keep whatever the failing detector had queued, ahead of the error
+            self.flush_output()
             print(f"Error during analysis: {e}")
             import traceback
             traceback.print_exc()
         finally:
+            self.flush_output()
             self.cleanup_logging()
 
+def load_ontology_tables(file_path):
+    """Worker-process loader: OntologyConflictDetector.load_ontology's tables as plain, picklable dicts"""
+    triple_count, index, subjects_by_type = OntologyConflictDetector([]).load_ontology(file_path)
+    return triple_count, {s: dict(po) for s, po in index.items()}, dict(subjects_by_type)
+
 def main():
     """Main function with enhanced command line argument parsing"""
     parser = argparse.ArgumentParser(description='Analyze ontology conflicts across multiple files')
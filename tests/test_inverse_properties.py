@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test for inverse property candidate detection.
+Checks name matches, label matches, de-duplication of pairs matched both ways,
+and the "... and N more pairs" count when the report is truncated.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir.parent))
+
+from onto_conflict_detect import OntologyConflictDetector
+
+NS = "http://example.org/inverse#"
+
+def detect_inverse(max_report):
+    """Run inverse detection on the example file and return (count, output)"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        detector = OntologyConflictDetector([str(test_dir / "inverse_example.ttl")],
+                                            "/tmp/inverse_test.log", max_report=max_report)
+        count = detector.detect_inverse_property_candidates()
+    return count, output.getvalue()
+
+def check(condition, message):
+    print(f"✅ PASSED: {message}" if condition else f"❌ FAILED: {message}")
+    return condition
+
+def run_test():
+    """Run the inverse property checks"""
+    print("=" * 80)
+    print("TEST: Inverse Property Candidates")
+    print("=" * 80)
+    
+    print("\n[TEST 1] Full report...")
+    count, output = detect_inverse(max_report=25)
+    results = [
+        check(count == 4 and "Found 4 potential inverse property pairs" in output,
+              "Four candidate pairs found"),
+        check(f"🔗 {NS}hasParent (hasParent)" in output and f"↔️  {NS}hasChild (hasChild)" in output,
+              "Name match (first side, second side)"),
+        check(f"🔗 {NS}ownedBy (ownedBy)" in output and f"↔️  {NS}owns (owns)" in output,
+              "Name match (second side, first side)"),
+        check(f"🔗 {NS}alpha (contains)" in output and f"↔️  {NS}beta (containedIn)" in output,
+              "Label-only match reports the first matching label pair"),
+        check(output.count(f"🔗 {NS}controls (") == 1
+              and f"🔗 {NS}controls (steers)" in output and f"↔️  {NS}controlledBy (is steered by)" in output,
+              "Name and label match reported once, with the name-match labels"),
+        check("more pairs" not in output, "No truncation note when all pairs are shown"),
+    ]
+    
+    print("\n[TEST 2] Report limited to 3 pairs...")
+    count, output = detect_inverse(max_report=3)
+    results += [
+        check(count == 4 and "Found 4 potential inverse property pairs" in output,
+              "Total count is not affected by the limit"),
+        check(output.count("🔗 ") == 3 and "... and 1 more pairs" in output,
+              "Only the first 3 pairs are shown"),
+    ]
+    
+    if not all(results):
+        return False
+    
+    print("\n" + "=" * 80)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 80)
+    return True
+
+if __name__ == "__main__":
+    success = run_test()
+    sys.exit(0 if success else 1)
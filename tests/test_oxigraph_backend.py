@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test that the optional pyoxigraph loader builds the same lookup tables as rdflib.
+The comparisons are skipped when pyoxigraph is not installed.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from rdflib import Graph, Literal
+
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir.parent))
+
+import onto_conflict_detect
+from onto_conflict_detect import OntologyConflictDetector
+
+def as_plain(index):
+    """Nested defaultdicts -> plain dicts, so the two tables can be compared"""
+    return {s: {p: list(objects) for p, objects in po.items()} for s, po in index.items()}
+
+def run_test():
+    """Compare the rdflib and pyoxigraph tables for each example file"""
+    print("=" * 80)
+    print("TEST: pyoxigraph Loader Matches rdflib")
+    print("=" * 80)
+    
+    detector = OntologyConflictDetector([], "/tmp/oxigraph_backend_test.log")
+    
+    # "foo" and "foo"^^xsd:string are one term to pyoxigraph; rdflib must agree
+    print("\n[TEST] xsd:string literals...")
+    graph = Graph()
+    graph.parse(test_dir / "xsd_string_labels.ttl", format="turtle")
+    triple_count, index, _ = detector.build_index(graph)
+    labels = index["http://example.org/xsd#A"][onto_conflict_detect.RDFS_LABEL]
+    if triple_count != 2 or labels != [Literal("foo")]:
+        print(f"❌ FAILED: {triple_count} triples, labels {labels}")
+        return False
+    print("✅ PASSED: Plain and xsd:string labels load as one literal")
+    
+    if onto_conflict_detect.pyoxigraph is None:
+        print("\n⏭️  SKIPPED: pyoxigraph is not installed")
+        return True
+    
+    for ttl_file in sorted(test_dir.glob("*.ttl")):
+        print(f"\n[TEST] {ttl_file.name}...")
+        graph = Graph()
+        graph.parse(ttl_file, format="turtle")
+        rdflib_count, rdflib_index, rdflib_types = detector.build_index(graph)
+        triple_count, ox_index, ox_types = detector.build_index_oxigraph(str(ttl_file))
+        
+        if triple_count != rdflib_count:
+            print(f"❌ FAILED: {triple_count} triples loaded, rdflib path has {rdflib_count}")
+            return False
+        if as_plain(ox_index) != as_plain(rdflib_index):
+            print("❌ FAILED: Subject -> predicate -> objects tables differ")
+            return False
+        if dict(ox_types) != dict(rdflib_types):
+            print("❌ FAILED: rdf:type -> subjects lists differ")
+            return False
+        print("✅ PASSED: Same triple count and lookup tables")
+    
+    # Document blank node labels must not be shared between parses
+    print("\n[TEST] Blank node labels...")
+    with tempfile.NamedTemporaryFile("w", suffix=".ttl", delete=False) as f:
+        f.write('@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n'
+                '_:b0 rdfs:label "anonymous" .\n')
+    try:
+        first = set(detector.build_index_oxigraph(f.name)[1])
+        second = set(detector.build_index_oxigraph(f.name)[1])
+    finally:
+        Path(f.name).unlink()
+    if first & second:
+        print("❌ FAILED: Blank node label reused across parses")
+        return False
+    print("✅ PASSED: Blank nodes get fresh labels on each parse")
+    
+    print("\n" + "=" * 80)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 80)
+    return True
+
+if __name__ == "__main__":
+    success = run_test()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test that loading files in worker processes gives the same tables and messages
+as loading them one at a time, independent of how many CPUs this machine has.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+test_dir = Path(__file__).parent
+sys.path.insert(0, str(test_dir.parent))
+
+import onto_conflict_detect
+from onto_conflict_detect import OntologyConflictDetector
+
+FILES = [str(test_dir / name) for name in
+         ("example1.ttl", "example2.ttl", "missing.ttl", "split_declarations.ttl", "split_annotations.ttl")]
+
+def as_plain(index):
+    """Nested defaultdicts -> plain dicts, so the two tables can be compared"""
+    return {s: {p: list(objects) for p, objects in po.items()} for s, po in index.items()}
+
+def load(cpu_count):
+    """Load FILES as if the machine had cpu_count CPUs; returns (detector, output)"""
+    real_cpu_count = onto_conflict_detect.os.cpu_count
+    onto_conflict_detect.os.cpu_count = lambda: cpu_count
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            detector = OntologyConflictDetector(FILES, "/tmp/parallel_load_test.log")
+    finally:
+        onto_conflict_detect.os.cpu_count = real_cpu_count
+    return detector, output.getvalue()
+
+def check(condition, message):
+    print(f"✅ PASSED: {message}" if condition else f"❌ FAILED: {message}")
+    return condition
+
+def run_test():
+    """Compare a sequential load with a process-pool load"""
+    print("=" * 80)
+    print("TEST: Parallel Loading Matches Sequential Loading")
+    print("=" * 80)
+    
+    print("\n[TEST] Loading with 1 and with 4 CPUs...")
+    sequential, sequential_output = load(cpu_count=1)
+    parallel, parallel_output = load(cpu_count=4)
+    results = [
+        check(parallel_output == sequential_output and "Error: File not found" in parallel_output,
+              "Same messages, in input order"),
+        check({f: as_plain(index) for f, index in parallel.indexes.items()}
+              == {f: as_plain(index) for f, index in sequential.indexes.items()},
+              "Same per-file lookup tables"),
+        check(as_plain(parallel.combined_index) == as_plain(sequential.combined_index)
+              and dict(parallel.combined_subjects) == dict(sequential.combined_subjects),
+              "Same combined view"),
+        check(all(s is sys.intern(s) and all(p is sys.intern(p) for p in po)
+                  for s, po in parallel.combined_index.items()),
+              "Subjects and predicates from worker processes are interned"),
+    ]
+    
+    if not all(results):
+        return False
+    
+    print("\n" + "=" * 80)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 80)
+    return True
+
+if __name__ == "__main__":
+    success = run_test()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Regression test for ontologies split across files.
+Labels, domains and ranges stated in a file that does not itself declare
+the term must still count for the combined analysis.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+def run_test():
+    """Run the conflict detector on declarations and annotations kept in separate files"""
+    test_dir = Path(__file__).parent
+    declarations = test_dir / "split_declarations.ttl"
+    annotations = test_dir / "split_annotations.ttl"
+    script = test_dir.parent / "onto_conflict_detect.py"
+    
+    print("=" * 80)
+    print("REGRESSION TEST: Annotations in a Separate File")
+    print("=" * 80)
+    
+    for mode in ([], ["--agnostic"]):
+        print(f"\n[TEST] Running {'with --agnostic' if mode else 'in default mode'}...")
+        result = subprocess.run(
+            [sys.executable, str(script), str(declarations), str(annotations), *mode, "-o", "/tmp"],
+            capture_output=True,
+            text=True
+        )
+        
+        if result.returncode != 0:
+            print(f"❌ FAILED: Script exited with code {result.returncode}")
+            print("STDERR:", result.stderr)
+            return False
+        
+        output = result.stdout
+        
+        # The label for Foo comes from the annotations file
+        if "All classes have labels" in output:
+            print("✅ PASSED: Class label from the other file is used")
+        else:
+            print("❌ FAILED: Class reported without label")
+            return False
+        
+        # The domain of p and the range of hasParent come from the annotations file
+        if "All properties have domain or range specified" in output:
+            print("✅ PASSED: Property domain/range from the other file is used")
+        else:
+            print("❌ FAILED: Properties reported without domain/range")
+            return False
+    
+    print("\n" + "=" * 80)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 80)
+    return True
+
+if __name__ == "__main__":
+    success = run_test()
+    sys.exit(0 if success else 1)